@@ -13,120 +13,136 @@ import csv
 import time
 import subprocess
 import json
-
-#check if the rich module exists, if not, install it
-try:
-    from rich import print
-    from rich import pretty
-except ImportError:
-    subprocess.call([sys.executable, "-m", "pip", "install", "rich"])
-    import rich
-    time.sleep (1)
-     #tell the user the library is installed
-    print("[!] Rich module is now installed")
-    print("Please restart the program")
-    time.sleep(3)
-    sys.exit()
-
-#Try to upgrade the rich module to the latest version
-try:
-    subprocess.call([sys.executable, "-m", "pip", "install", "--upgrade", "rich"])
-except:
-    pass
-
-#check if the tqdm module exists, if not install it
-try :
-    from tqdm import tqdm
-except ImportError:
-    subprocess.call([sys.executable, "-m", "pip", "install", "tqdm"])
-     #tell the user the library is installed
-    print("[!] The tqdm library is now installed")
-    #tell the user to please restart the program
-    print("Please restart the program")
-    time.sleep(3)
-    sys.exit()
-
-#Try to upgrade the tqdm module to the latest version
-try:
-    subprocess.call([sys.executable, "-m", "pip", "install", "--upgrade", "tqdm"])
-except:
-    pass
-
-#check if the plotly module exists, if not install it
-try :
-    import plotly
-    import plotly.graph_objs as go
-except ImportError:
-    print("[!] Plotly library not installed, Installing...")
-    os.system("pip install plotly")
-    time.sleep(1)
-     #tell the user the library is installed
-    print("[!] Plotly library is now installed")
-    #tell the user to please restart the program
-    print("Please restart the program")
-    time.sleep(3)
-
-#try to upgrade the plotly module to the latest version
-try:
-    subprocess.call([sys.executable, "-m", "pip", "install", "--upgrade", "plotly"])
-    time.sleep(10)
-except:
-    pass
-
-#if the library requests is not installed, install it via pip
-try:
-    import requests
-except ImportError:
-    print("[!] The requests library is not installed. Installing...")
-    os.system("pip install requests")
-    time.sleep(1)
-    #tell the user the library is installed
-    print("[!] The requests library is now installed")
-    #tell the user to please restart the program
-    print("Please restart the program")
-    time.sleep(3)
-    sys.exit()
-
-#Try to upgrade the requests module to the latest version
-try:
-    subprocess.call([sys.executable, "-m", "pip", "install", "--upgrade", "requests"])
-except:
-    pass
-
-#if the csv library is not installed, install it via pip
-try:
-    import csv
-except ImportError:
-    print("[!] The csv library is not installed. Installing...")
-    os.system("pip install csv")
-    print("[!] The csv library has been installed.")
-    time.sleep(1)
-    #tell the user to please restart the program
-    print("Please restart the program")
-    time.sleep(3)
-    sys.exit()
-   
-
-#if the shutil library is not installed, install it via pip
-try:
-    import shutil
-except ImportError:
-    print("[!] The shutil library is not installed. Installing...")
-    os.system("pip install shutil")
-    print("[+] The shutil library has been installed.")
+import tempfile
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+
+#check that the rich, tqdm, plotly and requests modules exist, without loading them,
+#if any are missing install them all with a single pip call
+missing_modules = [module for module in ("rich", "tqdm", "plotly", "requests") if importlib.util.find_spec(module) is None]
+if missing_modules:
+    print("[!] Installing the missing libraries: " + ", ".join(missing_modules))
+    subprocess.call([sys.executable, "-m", "pip", "install"] + missing_modules)
+    #tell the user the libraries are installed
+    print("[!] The libraries are now installed")
     #tell the user to please restart the program
     print("Please restart the program")
     time.sleep(3)
     sys.exit()
 
+#plotly is only imported later, when the pie chart is drawn
+from rich import print
+from tqdm import tqdm
+import requests
 
-OUI_list = [] 
+OUI_set = set()
 OUI_list_final = []
-company_list =[]
+company_set = set()
 company_list_final = []
-vlan_list = []
+vlan_set = set()
+device_list = []
 vlan_list_final = []
-word_list = []
+
+#hex digits that make up a MAC address once the separators are removed
+HEX_DIGITS = set('0123456789abcdef')
+#translation table that strips the separators used by the Cisco (.), colon (:) and dash (-) MAC formats
+MAC_SEPARATORS = str.maketrans('', '', '.:-')
+#size of the read buffer for the input file and the IEEE OUI registry (1 MiB, a multiple of the 4 KiB page size),
+#so the ~6MB registry is read in a handful of read calls instead of hundreds of 8 KiB ones
+READ_BUFFER_SIZE = 1 << 20
+#number of OUI database requests that are sent at the same time
+LOOKUP_THREADS = 8
+#seconds to wait before asking the OUI database once more when it answers 429 (too many requests),
+#if it does not say how long to wait (Retry-After), and the most that is waited in any case
+RATE_LIMIT_WAIT = 1
+RATE_LIMIT_MAX_WAIT = 10
+#Google Chrome and Firefox on Windows, Linux and Mac, the pie chart is only drawn if one of them is installed
+BROWSER_PATHS = (
+    'C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe',
+    'C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe',
+    'C:\\Program Files\\Mozilla Firefox\\firefox.exe',
+    '/usr/bin/google-chrome',
+    '/usr/bin/firefox',
+    '/Applications/Google Chrome.app',
+    '/Applications/Firefox.app',
+)
+#folder of NetVendor.py (or of the built NetVendor program), where the OUI cache and registry are kept,
+#the built program uses the path of its exe, as sys.argv[0] is only its bare name when it is started from the PATH
+if getattr(sys, 'frozen', False):
+    APP_DIR = os.path.dirname(sys.executable)
+else:
+    APP_DIR = os.path.dirname(os.path.abspath(sys.argv[0]))
+#file that keeps the vendor of every OUI found by earlier runs, so it is not requested again
+OUI_CACHE_FILE = os.path.join(APP_DIR, 'oui_cache.json')
+#the IEEE OUI registry, it is downloaded to APP_DIR (not as a .txt file, so it is not moved to the
+#text_files folder) and downloaded again when it is older than 30 days
+OUI_REGISTRY_URL = 'https://standards-oui.ieee.org/oui/oui.txt'
+OUI_REGISTRY_FILE = os.path.join(APP_DIR, 'ieee_oui.cache')
+OUI_REGISTRY_MAX_AGE = 30 * 24 * 60 * 60
+#the IEEE site turns away clients that don't look like a browser, so the download sends a browser User-Agent
+OUI_REGISTRY_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) NetVendor'}
+#file next to the registry whose date is the last time the registry download failed, so a failed download of an
+#out of date registry is only tried again after a day (a missing registry is always downloaded), a good download deletes it
+OUI_REGISTRY_ATTEMPT_FILE = OUI_REGISTRY_FILE + '.attempt'
+OUI_REGISTRY_RETRY_AGE = 24 * 60 * 60
+
+#OUIs (in the Cisco "xxxx.xx" format) of the devices that are collected into their own files,
+#a few of them are only the first 5 hex digits of an OUI (such as "7cd1.c") and match any 6th digit
+APPLE_OUIS = (
+    "0c4d.e9", "109a.dd", "10dd.b1", "28ff.3c", "38c9.86", "3c7d.0a", "501f.c6", "685b.35",
+    "7cd1.c", "8866.5a", "9c20.7b", "a860.b6", "d081.7a", "cc29.f5",
+)
+DELL_OUIS = (
+    "001a.a0", "004e.01", "14b3.1f", "14fe.b5", "1866.da", "28f1.0e", "484d.7e", "509a.4c",
+    "5448.10", "54bf.64", "6400.6a", "6c2b.59", "782b.cb", "8cec.4b", "a41f.72", "a4bb.6d",
+    "b083.fe", "b885.84", "b8ca.3a", "bc30.5b", "c81f.66", "d4be.d9", "d89e.f3", "e454.e8",
+    "e4f0.04", "f04d.a2", "f402.70", "f48e.38", "f8bc.12", "0006.5b", "0008.74", "000b.db",
+    "000d.56", "000f.1f", "0011.43", "0012.3f", "0013.72", "0014.22", "0015.c5", "0016.f0",
+    "0018.8b", "0019.b9", "01c2.3", "001d.09", "001e.4f", "001e.c9", "0021.70", "0021.9b",
+    "0022.19", "0023.ae", "0024.e8", "0025.64", "0026.b9", "00b0.d0", "00be.43", "00c0.4f",
+    "0892.04", "0c29.ef", "1065.30", "107d.1a", "1098.36", "1418.77", "149e.cf", "1803.73",
+    "185a.58", "18a9.9b", "18db.f2", "18fb.7b", "1c40.24", "1c72.1d", "2004.0f", "246e.96",
+    "2471.52", "24b6.fd", "2cea.7f", "30d0.42", "3417.eb", "448e.db", "3473.5a", "2047.47",
+)
+CISCO_MERAKI_OUIS = (
+    "ac17.c8", "f89e.28",
+)
+OTHER_CISCO_OUIS = (
+    "0007.7d", "0008.2f", "0021.a0", "0022.bd", "0023.5e", "003a.99", "005f.86", "00aa.6e",
+    "0cf5.a4", "1833.9d", "1ce8.5d", "30e4.db", "40f4.ec", "4403.a7", "4c4e.35", "544a.00",
+    "5486.bc", "588d.09", "58bf.ea", "6400.f1", "7c21.0d", "84b5.17", "8cb6.4f", "ac7e.8a",
+    "bc67.1c", "c4b3.6a", "d4ad.71", "e0d1.73", "e8b7.48", "f09e.63", "f866.f2", "0025.45",
+    "002a.6a",
+)
+MITEL_OUIS = (
+    "0800.0f",
+)
+HP_OUIS = (
+    "0017.a4", "001b.78", "0023.7d", "0030.6e", "009c.02", "1062.e5", "3024.a9", "308d.99",
+    "30e1.71", "3822.e2", "38ea.a7", "40b0.34", "68b5.99", "6cc2.17", "80ce.62", "80e8.2c",
+    "8434.97", "98e7.f4", "9cb6.54", "a08c.fd", "a0d3.c1", "a45d.36", "b00c.d1", "e4e7.49",
+    "ec8e.b5", "f092.1c", "f430.b9", "fc15.b4",
+)
+#the file that the devices of each vendor are collected into, with the OUIs of the vendor
+VENDOR_FILES = (
+    ('Apple-Devices.txt', APPLE_OUIS),
+    ('Dell-Devices.txt', DELL_OUIS),
+    ('Cisco-Meraki-Devices.txt', CISCO_MERAKI_OUIS),
+    ('Other-Cisco-Devices.txt', OTHER_CISCO_OUIS),
+    ('Mitel-Devices.txt', MITEL_OUIS),
+    ('HP-Devices.txt', HP_OUIS),
+)
+
+#map every vendor OUI to the file of the vendor, so the vendor of a device is found with a single dict lookup,
+#the 5 digit OUIs are added once for every possible 6th hex digit
+OUI_VENDOR_FILES = {}
+for file, ouis in VENDOR_FILES:
+    for oui in ouis:
+        if len(oui) == 7:
+            OUI_VENDOR_FILES[oui] = file
+        else:
+            for digit in HEX_DIGITS:
+                OUI_VENDOR_FILES[oui + digit] = file
 
 print('''[yellow]
 888888ba             dP   dP     dP                         dP                   
@@ -183,424 +199,294 @@ vlan_temp = input("> ")
 vlan_column = int(vlan_temp)
 vlan_word = vlan_column - 1
 
+#read the lines of the file once, every step below works on this list instead of re-opening the file
+with open(ip_arp_file, 'r', buffering=READ_BUFFER_SIZE, errors='replace') as f:
+    input_lines = f.readlines()
+
+
+#define a function to get a word (column) of a line, only splitting the line as far as that word,
+#it returns an empty string if the line is too short, such as a blank line
+def get_word(line, word):
+    words = line.split(None, word + 1)
+    if len(words) > word:
+        return words[word]
+    return ''
+
+#define a function to get the OUI of a MAC address in the Cisco "xxxx.xx" format,
+#whether the MAC is written as xxxx.xxxx.xxxx, xx:xx:xx:xx:xx:xx or xx-xx-xx-xx-xx-xx,
+#it returns None if the word is not a MAC address (such as a header or 'Incomplete')
+def get_oui(mac):
+    #strip the separators and make the MAC lowercase in one pass each
+    digits = mac.translate(MAC_SEPARATORS).lower()
+    #a valid MAC address is exactly 12 hex digits
+    if len(digits) != 12 or not HEX_DIGITS.issuperset(digits):
+        return None
+    return digits[0:4] + '.' + digits[4:6]
+
+#share one session between all the requests, so the connection to the OUI database is kept alive and reused,
+#with a connection pool that keeps one open connection for each lookup thread
+session = requests.Session()
+session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=LOOKUP_THREADS))
+
+#define a function to request the vendor of an OUI from the OUI database,
+#it returns None if the request timed out or failed (such as a dropped connection), so that OUI is skipped
+def get_vendor(oui):
+    url = "https://macvendors.co/api/vendorname/" + oui.upper()
+    #try to get the vendor for 2 seconds
+    try:
+        r = session.get(url, timeout=2)
+        #if the OUI database is rate limiting the requests, wait as long as it asks (or a second) and ask once more
+        if r.status_code == 429:
+            retry_after = r.headers.get('Retry-After', '')
+            wait = int(retry_after) if retry_after.isdigit() else RATE_LIMIT_WAIT
+            time.sleep(min(wait, RATE_LIMIT_MAX_WAIT))
+            r = session.get(url, timeout=2)
+        return r
+    except requests.exceptions.RequestException:
+        return None
+
+#define a function to replace a file with new data in one step, the data is written to a temporary file
+#that is then renamed over the file, so a crash or Ctrl+C never leaves a half written file behind,
+#if the write or the rename fails the temporary file is deleted and the OSError is raised to the caller
+def write_file_atomic(path, data):
+    temp_path = path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
 
-with open(ip_arp_file, 'r') as f:
-        for line in f:
-            #split the line into words
-            words = line.split()
-            #send words[mac_word] to a list
-            MAC_Element = words[mac_word]
-            #copy the first 7 characters to a new list called OUI_list
-            OUI_ELEMENT= MAC_Element[0:7]
-            #split oui_list into different elements
-            OUI_ELEMENT = OUI_ELEMENT.split()
-            #append OUI_ELEMENT to a list called OUI_list
-            OUI_list.append(OUI_ELEMENT)
-
-#sort OUI_list
-OUI_list.sort()
-
-#compare each element to the previous element, if the element is different, save the element
-for i in range(len(OUI_list)):
-    if OUI_list[i] != OUI_list[i-1]:
-        #save each different element to a new list called OUI_list_final
-        OUI_list_final.append(OUI_list[i])
-
-#save oui list final to a file called oui_list_final.txt
-with open('oui_list_final.txt', 'w') as f:
-    for i in range(len(OUI_list_final)):
-        f.write(OUI_list_final[i][0] + '\n')
-
-#close the file
-f.close()
+#define a function to load the IEEE OUI registry into a dict of OUI (in the "xxxx.xx" format) to vendor name,
+#the registry is downloaded first if it is missing or too old, if it can't be downloaded the old copy is used,
+#and with no copy at all it returns an empty dict, so every OUI is requested from the OUI database
+def load_oui_registry():
+    #the registry is downloaded if it is missing, or if it is older than 30 days and no download failed in the last day
+    try:
+        registry_age = time.time() - os.path.getmtime(OUI_REGISTRY_FILE)
+    except OSError:
+        registry_age = None
+    try:
+        failed_age = time.time() - os.path.getmtime(OUI_REGISTRY_ATTEMPT_FILE)
+    except OSError:
+        failed_age = None
+    if registry_age is None or (registry_age > OUI_REGISTRY_MAX_AGE and (failed_age is None or failed_age > OUI_REGISTRY_RETRY_AGE)):
+        print("\n[italic yellow]Downloading the IEEE OUI registry....[/italic yellow]")
+        downloaded = False
+        try:
+            #wait at most 5 seconds to connect, and 30 seconds for the data
+            r = session.get(OUI_REGISTRY_URL, headers=OUI_REGISTRY_HEADERS, timeout=(5, 30))
+            #only keep the download if it really is the registry
+            if r.status_code == 200 and '(base 16)' in r.text:
+                write_file_atomic(OUI_REGISTRY_FILE, r.content)
+                downloaded = True
+            else:
+                print("[bold red]##[/bold red] The IEEE OUI registry could not be downloaded (" + str(r.status_code) + " " + str(r.reason) + ")")
+        except requests.exceptions.RequestException:
+            print("[bold red]##[/bold red] The IEEE OUI registry could not be downloaded")
+        #if the registry can't be saved (such as a read only folder) carry on with the old copy, if there is one
+        except OSError as e:
+            print("[bold red]##[/bold red] The IEEE OUI registry could not be saved to [cyan]" + OUI_REGISTRY_FILE + "[/cyan]: " + str(e.strerror))
+
+        #record a failed download, so it is not tried again on every run, and forget it after a good one
+        try:
+            if downloaded:
+                os.remove(OUI_REGISTRY_ATTEMPT_FILE)
+            else:
+                with open(OUI_REGISTRY_ATTEMPT_FILE, 'w'):
+                    pass
+        except OSError:
+            pass
 
-#Check each line of the file oui_list_final.txt if it is 'MAC' delete it
-with open('oui_list_final.txt', 'r') as f:
-    lines = f.readlines()
-with open('oui_list_final.txt', 'w') as f:
-    for line in lines:
-        if line.strip("\n") != 'MAC':
-            f.write(line)
-#close the file
-f.close()
+    #every OUI in the registry has a line like "00000C     (base 16)    Cisco Systems, Inc"
+    registry = {}
+    try:
+        with open(OUI_REGISTRY_FILE, 'r', buffering=READ_BUFFER_SIZE, encoding='utf-8', errors='replace') as f:
+            for line in f:
+                if '(base 16)' in line:
+                    oui, _, vendor = line.partition('(base 16)')
+                    oui = oui.strip().lower()
+                    registry[oui[0:4] + '.' + oui[4:6]] = vendor.strip()
+    except OSError:
+        pass
+    return registry
 
-#Check each line of the file oui_list_final.txt if it is 'INCOMPL' delete it
-with open('oui_list_final.txt', 'r') as f:
-    lines = f.readlines()
+#load the vendors of the OUIs found by earlier runs, start with an empty cache if there is no (readable) cache file,
+#the OUIs that the OUI database did not know are in the cache too, as "No vendor", so they are not requested again
+try:
+    with open(OUI_CACHE_FILE, 'r') as f:
+        oui_cache = json.load(f)
+except (OSError, ValueError):
+    oui_cache = {}
+
+#the vendors that are known without a request, from the cache of earlier runs and the IEEE OUI registry,
+#the registry comes last, so an OUI that was "No vendor" is found again once it is added to the registry
+known_vendors = dict(oui_cache)
+known_vendors.update(load_oui_registry())
+
+#start the vendor requests with a small pool of threads while the file is still being read,
+#so the OUI database is already being asked about the first OUIs while the rest are found
+executor = ThreadPoolExecutor(max_workers=LOOKUP_THREADS)
+vendor_lookups = {}
+
+#collect the unique OUIs and vlans of the device entries in a single pass, and keep the device
+#entries with their OUI in device_list, so the MAC address of a line is only parsed once
+#(headers, separators and 'Incomplete' entries have no valid MAC address, so header words
+#such as "Interface" or "Vlan" are never counted as a VLAN either)
+for line in input_lines:
+    #get the OUI of the MAC address
+    OUI_ELEMENT = get_oui(get_word(line, mac_word))
+    #add OUI_ELEMENT to the set OUI_set if it is a valid MAC address
+    if OUI_ELEMENT:
+        #request the vendor of the OUI the first time it is seen, unless the vendor is already known
+        if OUI_ELEMENT not in OUI_set and OUI_ELEMENT not in known_vendors:
+            vendor_lookups[OUI_ELEMENT] = executor.submit(get_vendor, OUI_ELEMENT)
+        OUI_set.add(OUI_ELEMENT)
+        device_list.append((OUI_ELEMENT, line))
+        #add the vlan of the device to the set vlan_set
+        vlan_Element = get_word(line, vlan_word)
+        if vlan_Element:
+            vlan_set.add(vlan_Element)
+
+#sort the unique OUIs into a list called OUI_list_final
+OUI_list_final = sorted(OUI_set)
+
+#save oui list final to a file called oui_list_final.txt, one OUI per line in a single write
 with open('oui_list_final.txt', 'w') as f:
-    for line in lines:
-        if line.strip("\n") != 'INCOMPL':
-            f.write(line)
-
-#close the file
-f.close()
+    f.write(''.join(OUI + '\n' for OUI in OUI_list_final))
 
 #print please be patient the vendor information is being retrieved
 print("\n[italic yellow]Please be patient while the [cyan]company[/cyan] information is being retrieved[/italic yellow]\n")
 
-#for each line in the file oui_list_final.txt, store this in a list called vendor_list
-vendor_list = []
-with open('oui_list_final.txt', 'r') as f:
-    for line in f:
-        vendor_list.append(line)
-
-#for each element in vendor_list do a request to the OUI database
-for i in tqdm (range(len(vendor_list)), colour="cyan"):
-    #make each element uppercase
-    vendor_list[i] = vendor_list[i].upper()
-    #try to get the vendor for 2 seconds
-    try:
-        r = requests.get("https://macvendors.co/api/vendorname/" + vendor_list[i], timeout=2)
-        #if the request is successful, print the vendor name
-        if r.status_code == 200:
-        #save the vendor name to a file called vendor_list.txt
-            with open('oui_name_result.txt', 'a') as f:
-                f.write(r.text + '\n')
-        #else if the request is not successful, print the error message
-        else:
-            print("\nError:", r.status_code, r.reason)
-    except requests.exceptions.Timeout:
-        print("\nRequest Timed Out")
+#number of OUIs in the cache before the new answers are added
+cached_count = len(oui_cache)
+
+#get the vendor of every OUI in OUI_list_final, from the known vendors or from the requests that were started while reading the file
+vendor_names = []
+for OUI in tqdm(OUI_list_final, colour="cyan"):
+    #if the vendor of the OUI is already known, use the known vendor name (unless it is known to have no vendor)
+    if OUI in known_vendors:
+        if known_vendors[OUI] != 'No vendor':
+            vendor_names.append(known_vendors[OUI] + '\n')
+        continue
+    r = vendor_lookups[OUI].result()
+    #if the request timed out or failed, print the error message and skip the OUI
+    if r is None:
+        print("\nRequest Failed:", OUI)
+    #if the request is successful, keep the answer in the cache and the vendor name in the list vendor_names,
+    #unless the OUI database does not know the OUI ("No vendor")
+    elif r.status_code == 200:
+        oui_cache[OUI] = r.text
+        if r.text != 'No vendor':
+            vendor_names.append(r.text + '\n')
+    #else if the request is not successful, print the error message
+    else:
+        print("\nError:", r.status_code, r.reason)
 
-#close the file
-f.close()
+#all the requests are done, so let the threads go
+executor.shutdown()
 
-#Check each line of the file vendor_list.txt if it is "No vendor" delete it
+#save the cache for the next run if any new OUIs were answered, the cache is only a speed up,
+#so if it can't be saved (such as a read only folder) warn and carry on with the results of this run
+if len(oui_cache) > cached_count:
+    try:
+        write_file_atomic(OUI_CACHE_FILE, json.dumps(oui_cache, indent=2, sort_keys=True).encode('utf-8'))
+    except OSError as e:
+        print("\n[bold red]##[/bold red] The OUI cache could not be saved to [cyan]" + OUI_CACHE_FILE + "[/cyan]: " + str(e.strerror))
 
-with open('oui_name_result.txt', 'r') as f:
-    lines = f.readlines()
+#save all the vendor names to a file called oui_name_result.txt in a single write
 with open('oui_name_result.txt', 'w') as f:
-  for line in lines:
-      if line.strip("\n") != 'No vendor':
-          f.write(line)
-
-#close the file
-f.close()
-
-time.sleep(1)
+    f.write(''.join(vendor_names))
 
-#open the text file oui_name_result.txt and read it, look for company name
-with open('oui_name_result.txt', 'r') as f:
-    for line in f:
-        #load the line into a list called company_list
-        company_list.append(line)
+#add the vendor names to the set company_set, which keeps one copy of each company
+company_set.update(vendor_names)
 
-#close the file
-f.close()
-
-#sort company_list
-company_list.sort()
-
-#compare each element to the previous element, if the element is different, print the element
-for i in range(len(company_list)):
-    if company_list[i] != company_list[i-1]:
-        #save each different element to a new list called company_list_final
-        company_list_final.append(company_list[i])
+#sort the unique companies into a list called company_list_final
+company_list_final = sorted(company_set)
 
 print("\n\nThe companies seen in the [italic green]"+ ip_arp_file + "[/italic green] data file are:\n")
 
-#save the company list final to a file called company_list.txt
+#join the company list once, one company per line, the same text is saved and printed
+company_text = ''.join(company_list_final)
+
+#save the company list final to a file called company_list.txt in a single write
 with open('company_list.txt', 'w') as f:
-    for i in range(len(company_list_final)):
-        f.write(company_list_final[i])
+    f.write(company_text)
 
-#print the list company_list one element a t time
-for i in range(len(company_list_final)):
-    #remove the new line character from the end of the line
-    company_list_final[i] = company_list_final[i].rstrip()
-    #print the element in cyan
-    print("[cyan]" + company_list_final[i] + "[/cyan]")
+#print the whole company list in cyan with a single print
+print("[cyan]" + company_text.rstrip() + "[/cyan]")
 
 #Collecting the output of the command sh ip arp
 print ("\n\n[italic yellow]Please be patient, while information is being retrieved[/italic yellow]\n")
 
 #######################################################################################
 
-#Finding all the Apple ARP Entries ....
-
-#Delete the file Apple-Devices.txt if it exists
-if os.path.exists('Apple-Devices.txt'):
-    os.remove('Apple-Devices.txt')
-else :
-    pass
-
-print ("\nFinding any [cyan]Apple[/cyan] devices in the [italic green]" + ip_arp_file + "[/italic green] file....")
-#For every line in the file check the MAC address, if it is an Apple Address, add it the Apple-Devices.txt
-with open(ip_arp_file, 'r') as f:
-    for line in tqdm(f, colour="cyan"):
-       #split the line into words
-        words = line.split()
-        #if words[mac_word] starts with Apple OUI add it to the Apple-Devices.txt file 
-        if words[mac_word].startswith("0c4d.e9") or words[mac_word].startswith("109a.dd") or words[mac_word].startswith("10dd.b1") or words[mac_word].startswith("28ff.3c") or words[mac_word].startswith("38c9.86") or words[mac_word].startswith("3c7d.0a") or words[mac_word].startswith("501f.c6")or words[mac_word].startswith("685b.35") or words[mac_word].startswith("7cd1.c")or words[mac_word].startswith("8866.5a") or words[mac_word].startswith("9c20.7b") or words[mac_word].startswith("a860.b6") or words[mac_word].startswith("d081.7a") or words[mac_word].startswith("cc29.f5"):
-            with open('Apple-Devices.txt', 'a') as f:
-                f.write(line)
-                time.sleep(0.1)
-#close the files
-f.close()
-
-if os.path.exists('Apple-Devices.txt'):
-#read the file Apple-Devices.txt and store the total number of lines in a variable called Apple-count
-    with open('Apple-Devices.txt', 'r') as f:
-        Apple_count = 0
-        for line in f:
-            Apple_count += 1
-else:
-    Apple_count = 0
-    pass
-
-#######################################################################################
-
-#Finding all the Dell ARP Entries ....
-
-#Delete the file Dell-Devices.txt if it exists
-if os.path.exists('Dell-Devices.txt'):
-    os.remove('Dell-Devices.txt')
-else :
-    pass
-
-print ("\nFinding any [cyan]Dell[/cyan] devices in the [italic green]" + ip_arp_file + "[/italic green] file....")
-
-#For every line in the file check the MAC address, if it is a Dell Address, add it the Dell-Devices.txt
-with open(ip_arp_file, 'r') as f:
-    for line in tqdm(f, colour="cyan"):
-       #split the line into words
-        words = line.split()
-        #if words[mac_word] starts with a Dell OUI add the line to the Dell-Devices.txt file 
-        if words[mac_word].startswith("001a.a0") or words[mac_word].startswith("004e.01") or words[mac_word].startswith("14b3.1f") or words[mac_word].startswith("14fe.b5") or words[mac_word].startswith("1866.da") or words[mac_word].startswith("28f1.0e") or words[mac_word].startswith("484d.7e")or words[mac_word].startswith("509a.4c") or words[mac_word].startswith("5448.10")or words[mac_word].startswith("54bf.64") or words[mac_word].startswith("6400.6a") or words[mac_word].startswith("6c2b.59") or words[mac_word].startswith("782b.cb") or words[mac_word].startswith("8cec.4b") or words[mac_word].startswith("a41f.72") or words[mac_word].startswith("a4bb.6d") or words[mac_word].startswith("b083.fe") or words[mac_word].startswith("b885.84") or words[mac_word].startswith("b8ca.3a") or words[mac_word].startswith("bc30.5b") or words[mac_word].startswith("c81f.66") or words[mac_word].startswith("d4be.d9") or words[mac_word].startswith("d89e.f3") or words[mac_word].startswith("e454.e8") or words[mac_word].startswith("e4f0.04") or words[mac_word].startswith("f04d.a2") or words[mac_word].startswith("f402.70") or words[mac_word].startswith("f48e.38") or words[mac_word].startswith("f8bc.12") or words[mac_word].startswith("0006.5b") or words[mac_word].startswith("0008.74") or words[mac_word].startswith("000b.db") or words[mac_word].startswith("000d.56") or words[mac_word].startswith("000f.1f") or words[mac_word].startswith("0011.43")  or words[mac_word].startswith("0012.3f") or words[mac_word].startswith("0013.72") or words[mac_word].startswith("0014.22") or words[mac_word].startswith("0015.c5") or words[mac_word].startswith("0016.f0") or words[mac_word].startswith("0018.8b") or words[mac_word].startswith("0019.b9") or words[mac_word].startswith("01c2.3") or words[mac_word].startswith("001d.09") or words[mac_word].startswith("001e.4f")  or words[mac_word].startswith("001e.c9") or words[mac_word].startswith("0021.70") or words[mac_word].startswith("0021.9b") or words[mac_word].startswith("0022.19")  or words[mac_word].startswith("0023.ae") or words[mac_word].startswith("0024.e8") or words[mac_word].startswith("0025.64") or words[mac_word].startswith("0026.b9") or words[mac_word].startswith("00b0.d0") or words[mac_word].startswith("00be.43") or words[mac_word].startswith("00c0.4f") or words[mac_word].startswith("0892.04") or words[mac_word].startswith("0c29.ef") or words[mac_word].startswith("1065.30") or words[mac_word].startswith("107d.1a") or words[mac_word].startswith("1098.36") or words[mac_word].startswith("1418.77") or words[mac_word].startswith("149e.cf") or words[mac_word].startswith("1803.73") or words[mac_word].startswith("185a.58") or words[mac_word].startswith("18a9.9b") or words[mac_word].startswith("18db.f2") or words[mac_word].startswith("18fb.7b") or words[mac_word].startswith("1c40.24") or words[mac_word].startswith("1c72.1d")  or words[mac_word].startswith("2004.0f") or words[mac_word].startswith("246e.96") or words[mac_word].startswith("2471.52") or words[mac_word].startswith("24b6.fd") or words[mac_word].startswith("2cea.7f") or words[mac_word].startswith("30d0.42") or words[mac_word].startswith("3417.eb") or words[mac_word].startswith("448e.db") or words[mac_word].startswith("3473.5a") or words[mac_word].startswith("18db.f2") or words[mac_word].startswith("18fb.7b") or words[mac_word].startswith("1c40.24") or words[mac_word].startswith("1c72.1d") or words[mac_word].startswith("2004.0f") or words[mac_word].startswith("2047.47") or words[mac_word].startswith("246e.96") or words[mac_word].startswith("2471.52") or words[mac_word].startswith("24b6.fd") or words[mac_word].startswith("2cea.7f") or words[mac_word].startswith("30d0.42") or words[mac_word].startswith("3417.eb")  :
-            with open('Dell-Devices.txt', 'a') as f:
-                f.write(line)
-                time.sleep(0.1)
-#close the files
-f.close()
-
-if os.path.exists('Dell-Devices.txt'):
-#read the file Dell-Devices.txt and store the total number of lines in a variable called Dell-count
-    with open('Dell-Devices.txt', 'r') as f:
-        Dell_count = 0
-        for line in f:
-            Dell_count += 1
-else:
-    Dell_count = 0
-    pass
-
-#######################################################################################
-#Finding all the Cisco Meraki ARP Entries ....
-
-#Delete the file Cisco-Meraki-Devices.txt if it exists
-if os.path.exists('Cisco-Meraki-Devices.txt'):
-    os.remove('Cisco-Meraki-Devices.txt')
-else :
-    pass
-
-print ("\nFinding any [cyan]Cisco Meraki[/cyan] devices in the [italic green]" + ip_arp_file + "[/italic green] file....")
-
-#For every line in the file check the MAC address, if it is an Cisco-Meraki Address, add it the Cisco-Meraki-Devices.txt
-with open(ip_arp_file, 'r') as f:
-    for line in tqdm(f,colour='cyan'):
-       #split the line into words
-        words = line.split()
-        #if words[mac_word] starts with a Cisco-Meraki OUI add the line to the Cisco-Meraki-Devices.txt file 
-        if words[mac_word].startswith("ac17.c8") or words[mac_word].startswith("f89e.28"):
-            with open('Cisco-Meraki-Devices.txt', 'a') as f:
-                f.write(line)
-                time.sleep(0.1)
-#close the files
-f.close()
-
-if os.path.exists('Cisco-Meraki-Devices.txt'):
-#read the file Cisco-Meraki-Devices.txt and store the total number of lines in a variable called Cisco-Meraki-count
-    with open('Cisco-Meraki-Devices.txt', 'r') as f:
-        CiscoMeraki_count = 0
-        for line in f:
-            CiscoMeraki_count += 1
-else:
-    CiscoMeraki_count = 0
-    pass
-
-#######################################################################################
-#Finding all the Other Cisco ARP Entries ....
-
-#Delete the file Other-Cisco-Devices.txt if it exists
-if os.path.exists('Other-Cisco-Devices.txt'):
-    os.remove('Other-Cisco-Devices.txt')
-else :
-    pass
-
-print ("\nFinding any other [cyan]Cisco[/cyan] devices in the [italic green]" + ip_arp_file + "[/italic green] file....")
-
-#For every line in the file check the MAC address, if it is an Other-Cisco Address, add it the Other-Cisco-Devices.txt
-with open(ip_arp_file, 'r') as f:
-    for line in tqdm(f, colour='cyan'):
-       #split the line into words
-        words = line.split()
-        #if words[mac_word] starts with a Other-Cisco OUI add the line to the Other-Cisco-Devices.txt file 
-        if words[mac_word].startswith("0007.7d") or words[mac_word].startswith("0008.2f") or words[mac_word].startswith("0021.a0") or words[mac_word].startswith("0022.bd") or words[mac_word].startswith("0023.5e") or words[mac_word].startswith("003a.99") or words[mac_word].startswith("005f.86") or words[mac_word].startswith("00aa.6e") or words[mac_word].startswith("0cf5.a4") or words[mac_word].startswith("1833.9d") or words[mac_word].startswith("1ce8.5d") or words[mac_word].startswith("30e4.db") or words[mac_word].startswith("40f4.ec") or words[mac_word].startswith("4403.a7") or words[mac_word].startswith("4c4e.35") or words[mac_word].startswith("544a.00") or words[mac_word].startswith("5486.bc") or words[mac_word].startswith("588d.09") or words[mac_word].startswith("58bf.ea") or words[mac_word].startswith("6400.f1") or words[mac_word].startswith("7c21.0d") or words[mac_word].startswith("84b5.17") or words[mac_word].startswith("8cb6.4f") or words[mac_word].startswith("ac17.c8") or words[mac_word].startswith("ac7e.8a") or words[mac_word].startswith("bc67.1c") or words[mac_word].startswith("c4b3.6a") or words[mac_word].startswith("d4ad.71") or words[mac_word].startswith("e0d1.73") or words[mac_word].startswith("e8b7.48") or words[mac_word].startswith("f09e.63") or words[mac_word].startswith("f866.f2") or words[mac_word].startswith("0025.45") or words[mac_word].startswith("002a.6a") :
-            with open('Other-Cisco-Devices.txt', 'a') as f:
-                f.write(line)
-                time.sleep(0.1)
-#close the files
-f.close()
-
-if os.path.exists('Other-Cisco-Devices.txt'):
-#read the file Other-Cisco-Devices.txt and store the total number of lines in a variable called Other-Cisco-count
-    with open('Other-Cisco-Devices.txt', 'r') as f:
-        OtherCisco_count = 0
-        for line in f:
-            OtherCisco_count += 1
-else:
-    OtherCisco_count = 0
-    pass
-
-#######################################################################################
-
-#sleep for 1 second
-time.sleep(1)
-
-#Finding all the Mitel Corperation Entries ....
-
-#Delete the file Mitel-Devices.txt if it exists
-if os.path.exists('Mitel-Devices.txt'):
-    os.remove('Mitel-Devices.txt')
-else :
-    pass
-
-print ("\nFinding any [cyan]Mitel[/cyan] devices in the [italic green]" + ip_arp_file + "[/italic green] file....")
-
-#For every line in the file check the MAC address, if it is an Mitel Address, add it the Mitel-Devices.txt
-with open(ip_arp_file, 'r') as f:
-    for line in tqdm(f, colour='cyan'):
-       #split the line into words
-        words = line.split()
-        #if words[mac_word] starts with a Mitel OUI add the line to the Mitel-Devices.txt file 
-        if words[mac_word].startswith("0800.0f") :
-            with open('Mitel-Devices.txt', 'a') as f:
-                f.write(line)
-                time.sleep(0.1)
-#close the files
-f.close()
-
-if os.path.exists('Mitel-Devices.txt'):
-#read the file Mitel-Devices.txt and store the total number of lines in a variable called Mitel-count
-    with open('Mitel-Devices.txt', 'r') as f:
-        Mitel_count = 0
-        for line in f:
-            Mitel_count += 1
-else:
-    Mitel_count = 0
-    pass
-
-#######################################################################################
-
-#Finding all the HP ARP Entries ....
-
-#Delete the file HP-Devices.txt if it exists
-if os.path.exists('HP-Devices.txt'):
-    os.remove('HP-Devices.txt')
-else :
-    pass
-
-print ("\nFinding any [cyan]HP[/cyan] devices in the [italic green]" + ip_arp_file + "[/italic green] file....")
-
-#For every line in the file check the MAC address, if it is an HP OUI Address, add it the HP-Devices.txt
-with open(ip_arp_file, 'r') as f:
-    for line in tqdm(f, colour='cyan'):
-       #split the line into words
-        words = line.split()
-        #if words[mac_word] starts with a HP OUI add the line to the HP-Devices.txt file 
-        if words[mac_word].startswith("0017.a4") or words[mac_word].startswith("001b.78") or words[mac_word].startswith("0023.7d") or words[mac_word].startswith("0030.6e") or words[mac_word].startswith("009c.02") or words[mac_word].startswith("1062.e5") or words[mac_word].startswith("3024.a9") or words[mac_word].startswith("308d.99") or words[mac_word].startswith("30e1.71") or words[mac_word].startswith("3822.e2") or words[mac_word].startswith("38ea.a7") or words[mac_word].startswith("40b0.34") or words[mac_word].startswith("68b5.99") or words[mac_word].startswith("6cc2.17") or words[mac_word].startswith("80ce.62") or words[mac_word].startswith("80e8.2c") or words[mac_word].startswith("8434.97") or words[mac_word].startswith("98e7.f4") or words[mac_word].startswith("9cb6.54") or words[mac_word].startswith("a08c.fd") or words[mac_word].startswith("a0d3.c1") or words[mac_word].startswith("a45d.36") or words[mac_word].startswith("b00c.d1") or words[mac_word].startswith("e4e7.49") or words[mac_word].startswith("ec8e.b5") or words[mac_word].startswith("f092.1c") or words[mac_word].startswith("f430.b9") or words[mac_word].startswith("fc15.b4") :
-            with open('HP-Devices.txt', 'a') as f:
-                f.write(line)
-                time.sleep(0.1)
-#close the files
-f.close()
-
-if os.path.exists('HP-Devices.txt'):
-#read the file HP-Devices.txt and store the total number of lines in a variable called HP-count
-    with open('HP-Devices.txt', 'r') as f:
-        HP_count = 0
-        for line in f:
-            HP_count += 1
-else:
-    HP_count = 0
-    pass
+#Finding all the Apple, Dell, Cisco Meraki, other Cisco, Mitel and HP ARP Entries ....
+
+print ("\nFinding any [cyan]Apple[/cyan], [cyan]Dell[/cyan], [cyan]Cisco Meraki[/cyan], other [cyan]Cisco[/cyan], [cyan]Mitel[/cyan] and [cyan]HP[/cyan] devices in the [italic green]" + ip_arp_file + "[/italic green] file....")
+
+#collect the lines of the devices of each vendor in a single pass over the devices
+vendor_lines = {file: [] for file, _ in VENDOR_FILES}
+for OUI_ELEMENT, line in tqdm(device_list, colour="cyan"):
+    #if the OUI of the MAC address is one of the vendor OUIs keep the line for the vendor file
+    file = OUI_VENDOR_FILES.get(OUI_ELEMENT)
+    if file:
+        vendor_lines[file].append(line)
+
+#write the lines of each vendor to its file in a single write, a file is only made if the vendor has devices
+for file, lines in vendor_lines.items():
+    #Delete the old file if it exists
+    if os.path.exists(file):
+        os.remove(file)
+    if lines:
+        with open(file, 'w') as f:
+            f.write(''.join(lines))
+
+#the number of devices of each vendor is the number of lines collected for it
+Apple_count = len(vendor_lines['Apple-Devices.txt'])
+Dell_count = len(vendor_lines['Dell-Devices.txt'])
+CiscoMeraki_count = len(vendor_lines['Cisco-Meraki-Devices.txt'])
+OtherCisco_count = len(vendor_lines['Other-Cisco-Devices.txt'])
+Mitel_count = len(vendor_lines['Mitel-Devices.txt'])
+HP_count = len(vendor_lines['HP-Devices.txt'])
 
 #######################################################################################
 # Find all the unique vlans in the ip_arp_file
 print("\n[bold yellow]Misc details about the [italic green]" + ip_arp_file + "[/italic green] file....[/bold yellow]")
 
-with open(ip_arp_file, 'r') as f:
-        for line in f:
-            #split the line into words
-            vlanwords = line.split()
-            #send words[vlanword] to a list
-            vlan_Element = vlanwords[vlan_word]
-            #split vlan_Element into different elements
-            vlan_Element = vlan_Element.split()
-            #append vlan_Element to a list called vlan_list
-            vlan_list.append(vlan_Element)
-
-#sort the vlan_list
-vlan_list.sort()
-
-#compare each element to the previous element, if the element is different, save the element
-for i in range(len(vlan_list)):
-    if vlan_list[i] != vlan_list[i-1]:
-        #save each different element to a new list called vlan_list_final
-        vlan_list_final.append(vlan_list[i])
-
-#save oui list final to a file called vlan_list_final.txt
-with open('vlan_list.txt', 'w') as f:
-    for i in range(len(vlan_list_final)):
-        f.write(vlan_list_final[i][0] + '\n')
+#define a function to sort vlans by number, so Vlan2 comes before Vlan10, with any
+#non-numbered vlans after them in alphabetical order
+def vlan_sort_key(vlan):
+    number = vlan.lower().removeprefix('vlan')
+    if number.isdigit():
+        return (0, int(number), vlan)
+    return (1, 0, vlan)
 
-#close the files
-f.close()
+#sort the unique vlans, collected with the OUIs, into a list called vlan_list_final
+vlan_list_final = sorted(vlan_set, key=vlan_sort_key)
 
-#Check each line of the file vlan_list.txt if it is "Interface" delete it
-with open('vlan_list.txt', 'r') as f:
-    lines = f.readlines()
+#save vlan list final to a file called vlan_list.txt, one vlan per line in a single write
 with open('vlan_list.txt', 'w') as f:
-  for line in lines:
-      if line.strip("\n") != "Interface":
-          f.write(line)
-
-# count the lines in the file vlan_list_final.txt and print the number of lines
-with open('vlan_list.txt', 'r') as f:
-    vlan_count = 0
-    for line in f:
-        vlan_count += 1
-    print ("\n[bold yellow]++[/bold yellow] [bright_red]" + str(vlan_count) + "[/bright_red] unique [cyan]VLANs[/cyan]")
-    
+    f.write(''.join(vlan + '\n' for vlan in vlan_list_final))
 
-#######################################################################################
+#print the number of unique vlans, which is the length of the vlan list that was just saved
+print ("\n[bold yellow]++[/bold yellow] [bright_red]" + str(len(vlan_list_final)) + "[/bright_red] unique [cyan]VLANs[/cyan]")
 
 
-# count the lines in the file oui_list_final.txt and print the number of lines
+#######################################################################################
 
-with open('oui_list_final.txt', 'r') as f:
-    OUI_count = 0
-    for line in f:
-        OUI_count += 1
-    print ("[bold yellow]++[/bold yellow] [bright_red]" + str(OUI_count) + "[/bright_red] unique [cyan]OUI's[cyan]  ")
-    f.close()
-    
 
-#count the lines in the file company_list.txt and print the number of lines
-with open('company_list.txt', 'r') as f:
-    count = 0
-    for line in f:
-        count += 1
-    print ("[bold yellow]++[/bold yellow] [bright_red]" + str(count) + "[/bright_red] [cyan]companies[/cyan]")
-    f.close()
-    
-#count the lines in the ip_arp_file.txt and print the number of lines
-with open( ip_arp_file, 'r') as f:
-    count = 0
-    for line in f:
-        count += 1
-    print ("[bold yellow]++[/bold yellow] [bright_red]" + str(count) + "[/bright_red] [cyan]total devices[/cyan] ")
-    arpcount = count-1
-    f.close()
+#print the number of unique OUIs and companies, from the lists that were saved to oui_list_final.txt and company_list.txt
+print ("[bold yellow]++[/bold yellow] [bright_red]" + str(len(OUI_list_final)) + "[/bright_red] unique [cyan]OUI's[cyan]  ")
+print ("[bold yellow]++[/bold yellow] [bright_red]" + str(len(company_list_final)) + "[/bright_red] [cyan]companies[/cyan]")
+
+#print the number of device entries found while collecting the OUIs
+print ("[bold yellow]++[/bold yellow] [bright_red]" + str(len(device_list)) + "[/bright_red] [cyan]total devices[/cyan] ")
+arpcount = len(device_list)
 
 OtherTotal = arpcount - (Apple_count + Dell_count + CiscoMeraki_count + OtherCisco_count + HP_count + Mitel_count)
 
@@ -624,82 +510,43 @@ print("\n")
 labels = ['Apple', 'Dell', 'Cisco-Meraki', 'Other Cisco', 'HP', 'Mitel','Other']
 values = [Apple_count, Dell_count, CiscoMeraki_count, OtherCisco_count, HP_count, Mitel_count, OtherTotal]
 
-#check if Google Chrome or Firefox or is installed on Windows, Linux or Mac
-if os.path.exists('C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe') or os.path.exists('C:\\Program Files\\Google\\Chrome\\Application\\Firefox.exe'):
-    fig =go.Figure(data=[go.Pie(labels=labels, values=values)])
-    fig.show()
-elif os.path.exists('/usr/bin/google-chrome') or os.path.exists('/usr/bin/firefox'):
-    fig =go.Figure(data=[go.Pie(labels=labels, values=values)])
-    fig.show()
-elif os.path.exists('/Applications/Google Chrome.app') or os.path.exists('/Applications/Firefox.app'):
-    fig =go.Figure(data=[go.Pie(labels=labels, values=values)])
-    fig.show()
-else:
-    pass   
+#define a function to open a chart in the browser, the chart page loads plotly.js from the plotly CDN
+#instead of having the whole library (~3MB) written into it, like fig.show() does
+def show_chart(fig):
+    chart_file = os.path.join(tempfile.gettempdir(), 'NetVendor-Chart.html')
+    fig.write_html(chart_file, include_plotlyjs='cdn', auto_open=True)
+
+#if Google Chrome or Firefox is installed, draw the pie chart, the search stops at the first browser found,
+#plotly is only imported here, so it is not loaded at all when there is no browser to show the chart
+if any(os.path.exists(path) for path in BROWSER_PATHS):
+    import plotly.graph_objs as go
+    fig = go.Figure(data=[go.Pie(labels=labels, values=values)])
+    show_chart(fig)
 
 #######################################################################################
-#define a function to convert the text file to a csv file
-def make_csv(file): 
+#define a function to make the csv file of a text file, from the lines that were written to the text file,
+#so the text file does not have to be read back
+def make_csv(file, lines): 
     
-    # Maybe set word_list to null may help having the CSV issue?
-    word_list.clear()
-
-    #open the file in read mode
-    with open(file, 'r') as f:
-        for line in f:
-            words = line.split()
-            word_list.append(words)  
-    #close the file
-    f.close()
-
     #create a new csv file
     csv_file =file.replace(".txt", ".csv")
-    time.sleep(0.5)
-
-    #save the word_list to the csv file
-    with open(csv_file, 'w') as f:
-        writer = csv.writer(f)
-        writer.writerows(word_list)
-    #close the file
-    f.close()
-    time.sleep(0.5)
-    
-    #Convert the newline characters to a PC format
-    with open(csv_file , 'r') as f:
-        data = f.read().replace('\r', '')
-    time.sleep(0.5)
-
-    #overwrite the file with the new data
-    with open(csv_file, 'w') as f:
-        f.write(data)
-    #close the file
-    f.close()
-    time.sleep(0.5)
-
-    #Remove duplicate \n characters from the file
-    with open(csv_file, 'r') as f:
-        data = f.read().replace('\n\n', '\n')
-    #close the file
-    f.close()
-    time.sleep(0.5)
 
-    #overwrite the file with the new data
-    with open(csv_file, 'w') as f:
-        f.write(data)
-    #close the file
-    f.close()
-    time.sleep(0.5)
+    #save the words of each line straight to the csv file with a single writerows call,
+    #the rows end with '\n', which the file turns into the line ending of the system (no blank rows on Windows),
+    #blank lines are skipped, so the csv file is finished in this one write
+    with open(csv_file, 'w') as csv_f:
+        writer = csv.writer(csv_f, lineterminator='\n')
+        writer.writerows(words for words in map(str.split, lines) if words)
 
     #if folder csv_files does not exist create it
     if not os.path.exists('csv_files'):
         os.makedirs('csv_files')
     else:
         pass
-    time.sleep(0.5) 
 
     #move the csv file to the csv_files folder, if a copy does not exist
     if not os.path.exists('csv_files/' + csv_file):
-        shutil.move(csv_file, 'csv_files/' + csv_file)
+        os.replace(csv_file, 'csv_files/' + csv_file)
     else:
         pass
 
@@ -711,49 +558,49 @@ print("[magenta]>>>[/magenta][italic green] oui_list_final.txt[/italic green] fi
 print("[magenta]>>>[/magenta][italic green] company_list.txt[/italic green] file for the list of [cyan]companies[/cyan]") 
 print("[magenta]>>>[/magenta][italic green] vlan_list.txt[/italic green] file for the list of [cyan]VLANs[/cyan]")
 
-if os.path.exists('Apple-Devices.txt'):
+if vendor_lines['Apple-Devices.txt']:
     print("[magenta]>>>[/magenta][italic green] Apple-Devices.txt[/italic green] file for the list of [cyan]Apple[/cyan] devices")
-    #call function make-csv to convert the text file to a csv file
-    make_csv('Apple-Devices.txt')
+    #call function make-csv to make the csv file from the lines of the text file
+    make_csv('Apple-Devices.txt', vendor_lines['Apple-Devices.txt'])
     f.close()
 else:
     pass
 
-if os.path.exists('Dell-Devices.txt'):
+if vendor_lines['Dell-Devices.txt']:
     print("[magenta]>>>[/magenta][italic green] Dell-Devices.txt[/italic green] file for the list of [cyan]Dell[/cyan] devices")
-    #call function make-csv to convert the text file to a csv file
-    make_csv('Dell-Devices.txt')
+    #call function make-csv to make the csv file from the lines of the text file
+    make_csv('Dell-Devices.txt', vendor_lines['Dell-Devices.txt'])
     f.close()
     pass
 
-if os.path.exists('Cisco-Meraki-Devices.txt'):
+if vendor_lines['Cisco-Meraki-Devices.txt']:
     print("[magenta]>>>[/magenta][italic green] Cisco-Meraki-Devices.txt[/italic green] file for the list of [cyan]Cisco-Meraki[/cyan] devices")
-    #call function make-csv to convert the text file to a csv file
-    make_csv('Cisco-Meraki-Devices.txt')
+    #call function make-csv to make the csv file from the lines of the text file
+    make_csv('Cisco-Meraki-Devices.txt', vendor_lines['Cisco-Meraki-Devices.txt'])
     f.close()   
 else:
     pass
 
-if os.path.exists('Other-Cisco-Devices.txt'):
+if vendor_lines['Other-Cisco-Devices.txt']:
     print("[magenta]>>>[/magenta][italic green] Other-Cisco-Devices.txt[/italic green] file for the list of [cyan]Other Cisco[/cyan] devices")
-    #call function make-csv to convert the text file to a csv file
-    make_csv('Other-Cisco-Devices.txt')
+    #call function make-csv to make the csv file from the lines of the text file
+    make_csv('Other-Cisco-Devices.txt', vendor_lines['Other-Cisco-Devices.txt'])
     f.close()
 else:
     pass
 
-if os.path.exists('HP-Devices.txt'):
+if vendor_lines['HP-Devices.txt']:
     print("[magenta]>>>[/magenta][italic green] HP-Devices.txt[/italic green] file for the list of [cyan]HP[/cyan] devices")
-    #call function make-csv to convert the text file to a csv file
-    make_csv('HP-Devices.txt')
+    #call function make-csv to make the csv file from the lines of the text file
+    make_csv('HP-Devices.txt', vendor_lines['HP-Devices.txt'])
     f.close()
 else:
     pass
 
-if os.path.exists('Mitel-Devices.txt'):
+if vendor_lines['Mitel-Devices.txt']:
     print("[magenta]>>>[/magenta][italic green] Mitel-Devices.txt[/italic green] file for the list of [cyan]Mitel[/cyan] devices")
-    #call function make-csv to convert the text file to a csv file
-    make_csv('Mitel-Devices.txt')
+    #call function make-csv to make the csv file from the lines of the text file
+    make_csv('Mitel-Devices.txt', vendor_lines['Mitel-Devices.txt'])
     f.close()
 else:
     pass
@@ -763,32 +610,22 @@ if os.path.exists('csv_files'):
     print("\n[bold yellow]##[/bold yellow] See the [cyan]csv_files[/cyan] folder for the csv files\n")
     pass 
 
-#Check if there are any .txt files in the current directory
-for file in os.listdir():
-    if file.endswith(".txt"):
-        if not os.path.exists('text_files'):
-            os.makedirs('text_files')
-        else:
-            pass
-    else:
-        pass
-
-#move the .txt files to the text_files folder
-for file in os.listdir():
-    if file.endswith(".txt"):
-        #if file does not exist in the text_files folder, then move it
-        if not os.path.exists('text_files/' + file):
-            shutil.move(file, 'text_files')
-        else:
-            print("[bold red]##[/bold red] The [cyan]" + file + "[cyan] file already exists in the [cyan]text_files[/cyan] folder")
-    else:
-        pass
+#move the .txt files to the text_files folder in a single pass over the current directory,
+#the text_files folder is made when the first .txt file is found
+with os.scandir() as entries:
+    for entry in entries:
+        if entry.name.endswith(".txt") and entry.is_file():
+            os.makedirs('text_files', exist_ok=True)
+            #if file does not exist in the text_files folder, then move it (a rename, the folder is on the same drive)
+            if not os.path.exists('text_files/' + entry.name):
+                os.replace(entry.name, 'text_files/' + entry.name)
+            else:
+                print("[bold red]##[/bold red] The [cyan]" + entry.name + "[cyan] file already exists in the [cyan]text_files[/cyan] folder")
 
 #close any remainng files
 f.close()
 
 #tell the user to press enter to quit
 input("\nPress enter to quit: ")
-time.sleep(3)
 #exit the program
 sys.exit()